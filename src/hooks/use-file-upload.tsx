@@ -13,6 +13,23 @@ export interface ParseError {
   raw?: string;
 }
 
+// Initial and maximum number of bytes read when looking for the header lines of a file
+const DETECTION_CHUNK_SIZE = 512;
+const MAX_DETECTION_BYTES = 64 * 1024;
+
+// Read just enough of the file to cover its first `lineCount` lines, growing the slice up to MAX_DETECTION_BYTES
+const readFirstLines = async (file: File, lineCount: number): Promise<string[]> => {
+  let end = DETECTION_CHUNK_SIZE;
+  let chunk = await file.slice(0, end).text();
+  
+  while (chunk.split('\n', lineCount + 1).length <= lineCount && end < file.size && end < MAX_DETECTION_BYTES) {
+    end = Math.min(end * 2, MAX_DETECTION_BYTES);
+    chunk = await file.slice(0, end).text();
+  }
+  
+  return chunk.split('\n', lineCount);
+};
+
 export function useFileUpload() {
   const [jobs, setJobs] = useState<UploadJob[]>([]);
   const [isUploading, setIsUploading] = useState(false);
@@ -23,8 +40,7 @@ export function useFileUpload() {
   const detectFileType = async (file: File): Promise<"dissolution" | "particle" | undefined> => {
     try {
       // Read first few lines of the file
-      const chunk = await file.slice(0, 500).text();
-      const firstLines = chunk.split('\n').slice(0, 2).join(' ').toLowerCase();
+      const firstLines = (await readFirstLines(file, 2)).join(' ').toLowerCase();
       
       // Look for keywords to identify file type
       if (firstLines.includes('vessel') || firstLines.includes('time point')) {
@@ -36,9 +52,10 @@ export function useFileUpload() {
       }
       
       // If can't detect from content, make a guess based on name
-      if (file.name.toLowerCase().includes('diss')) {
+      const fileName = file.name.toLowerCase();
+      if (fileName.includes('diss')) {
         return "dissolution";
-      } else if (file.name.toLowerCase().includes('part') || file.name.toLowerCase().includes('size')) {
+      } else if (fileName.includes('part') || fileName.includes('size')) {
         return "particle";
       }
       
@@ -33,7 +33,8 @@ export interface ParseResult<T> {
 // Parse CSV content
 const parseCSV = (content: string): string[][] => {
   const lines = content.split('\n');
-  return lines.map(line => line.split(',').map(cell => cell.trim()));
+  // Blank lines are kept as a single empty cell (preserving line numbers) without being tokenized
+  return lines.map(line => line === "" || line === "\r" ? [""] : line.split(',').map(cell => cell.trim()));
 };
 
 // Parse dissolution test data
@@ -43,19 +44,24 @@ export const parseDissolutionData = (content: string): ParseResult<DissolutionDa
     
     // Validate header
     const header = rows[0];
-    const timePointIndex = header.findIndex(col => col.toLowerCase().includes('time'));
-    
-    if (timePointIndex === -1) {
-      throw new Error("Missing 'Time Point' column in header");
-    }
     
+    // Classify the time point and vessel columns in a single pass over the header
+    let timePointIndex = -1;
     const vesselIndices: number[] = [];
     for (let i = 0; i < header.length; i++) {
-      if (header[i].toLowerCase().includes('vessel')) {
+      const col = header[i].toLowerCase();
+      if (timePointIndex === -1 && col.includes('time')) {
+        timePointIndex = i;
+      }
+      if (col.includes('vessel')) {
         vesselIndices.push(i);
       }
     }
     
+    if (timePointIndex === -1) {
+      throw new Error("Missing 'Time Point' column in header");
+    }
+    
     if (vesselIndices.length === 0) {
       throw new Error("No 'Vessel' columns found in header");
     }
@@ -91,6 +97,7 @@ export const parseDissolutionData = (content: string): ParseResult<DissolutionDa
       }
       
       const vessels: number[] = [];
+      let vesselSum = 0;
       for (const index of vesselIndices) {
         if (index < row.length) {
           const value = parseFloat(row[index]);
@@ -103,6 +110,7 @@ export const parseDissolutionData = (content: string): ParseResult<DissolutionDa
             };
           }
           vessels.push(value);
+          vesselSum += value;
         } else {
           throw {
             message: "Missing vessel value",
@@ -113,8 +121,8 @@ export const parseDissolutionData = (content: string): ParseResult<DissolutionDa
         }
       }
       
-      // Calculate average
-      const average = vessels.reduce((sum, value) => sum + value, 0) / vessels.length;
+      // Average from the sum accumulated while reading the vessel cells
+      const average = vesselSum / vessels.length;
       
       data.push({
         timePoint,
@@ -147,18 +155,27 @@ export const parseParticleData = (content: string): ParseResult<ParticleData> =>
     
     // Validate header
     const header = rows[0];
+    const lowerHeader = header.map(col => col.toLowerCase());
     const requiredColumns = ['batch', 'd10', 'd50', 'd90', 'span', 'surface'];
     
     const columnIndices: Record<string, number> = {};
     
     for (const required of requiredColumns) {
-      const index = header.findIndex(col => col.toLowerCase().includes(required));
+      const index = lowerHeader.findIndex(col => col.includes(required));
       if (index === -1) {
         throw new Error(`Missing required column that contains '${required}' in header`);
       }
       columnIndices[required] = index;
     }
     
+    // Resolve column positions once instead of looking them up per cell
+    const batchCol = columnIndices['batch'];
+    const d10Col = columnIndices['d10'];
+    const d50Col = columnIndices['d50'];
+    const d90Col = columnIndices['d90'];
+    const spanCol = columnIndices['span'];
+    const surfaceCol = columnIndices['surface'];
+    
     // Parse data rows
     const data: ParticleData[] = [];
     
@@ -166,43 +183,39 @@ export const parseParticleData = (content: string): ParseResult<ParticleData> =>
       const row = rows[i];
       if (row.length <= 1 || row.every(cell => cell === "")) continue; // Skip empty rows
       
-      try {
-        const batchId = row[columnIndices['batch']];
-        if (!batchId) {
-          throw {
-            message: "Missing batch ID",
-            details: `Row ${i} has no batch ID`,
-            line: i,
-            raw: rows[i].join(',')
-          };
-        }
-        
-        const d10 = parseFloat(row[columnIndices['d10']]);
-        const d50 = parseFloat(row[columnIndices['d50']]);
-        const d90 = parseFloat(row[columnIndices['d90']]);
-        const span = parseFloat(row[columnIndices['span']]);
-        const specificSurface = parseFloat(row[columnIndices['surface']]);
-        
-        if (isNaN(d10) || isNaN(d50) || isNaN(d90) || isNaN(span) || isNaN(specificSurface)) {
-          throw {
-            message: "Invalid numeric value",
-            details: `Row ${i} has non-numeric values: d10=${row[columnIndices['d10']]}, d50=${row[columnIndices['d50']]}, d90=${row[columnIndices['d90']]}, span=${row[columnIndices['span']]}, specificSurface=${row[columnIndices['surface']]}`,
-            line: i,
-            raw: rows[i].join(',')
-          };
-        }
-        
-        data.push({
-          batchId,
-          d10,
-          d50,
-          d90,
-          span,
-          specificSurface
-        });
-      } catch (rowError: any) {
-        throw rowError;
+      const batchId = row[batchCol];
+      if (!batchId) {
+        throw {
+          message: "Missing batch ID",
+          details: `Row ${i} has no batch ID`,
+          line: i,
+          raw: rows[i].join(',')
+        };
       }
+      
+      const d10 = parseFloat(row[d10Col]);
+      const d50 = parseFloat(row[d50Col]);
+      const d90 = parseFloat(row[d90Col]);
+      const span = parseFloat(row[spanCol]);
+      const specificSurface = parseFloat(row[surfaceCol]);
+      
+      if (isNaN(d10) || isNaN(d50) || isNaN(d90) || isNaN(span) || isNaN(specificSurface)) {
+        throw {
+          message: "Invalid numeric value",
+          details: `Row ${i} has non-numeric values: d10=${row[d10Col]}, d50=${row[d50Col]}, d90=${row[d90Col]}, span=${row[spanCol]}, specificSurface=${row[surfaceCol]}`,
+          line: i,
+          raw: rows[i].join(',')
+        };
+      }
+      
+      data.push({
+        batchId,
+        d10,
+        d50,
+        d90,
+        span,
+        specificSurface
+      });
     }
     
     return {